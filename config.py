@@ -2,4 +2,8 @@
 DB_PATH = "reports/results.db"
 
 # Configuraciones del archivo excel
-EXCEL_PATH = "data/test_data.xlsx"
\ No newline at end of file
+EXCEL_PATH = "data/test_data.xlsx"
+REPORTS_DIR = "reports"  # Directorio de los archivos de registro de cada ejecución
+
+# Configuraciones de ejecución de las pruebas
+MAX_WORKERS = 32  # Número máximo de solicitudes que se envían en paralelo
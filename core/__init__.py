@@ -0,0 +1,5 @@
+import logging
+
+# Los módulos de `core` registran sus errores con `logging`; por defecto no se emite nada
+# hasta que el código que los usa configure sus propios manejadores
+logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -1,16 +1,66 @@
+from http.cookiejar import DefaultCookiePolicy
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
+
+
+class APIClientError(RequestException):
+    """
+    Excepción lanzada por `APIClient` cuando una solicitud no puede completarse
+    (por ejemplo, por un error de conexión o un tiempo de espera agotado).
+    Conserva el método y la URL de la solicitud para facilitar el diagnóstico.
+    """
+
+    def __init__(self, method, url, error):
+        """
+        Inicializa la excepción con los datos de la solicitud fallida.
+
+        Parámetros:
+        - method (str): El método HTTP de la solicitud.
+        - url (str): La URL completa de la solicitud.
+        - error (RequestException): El error original de `requests`.
+        """
+        super().__init__(f"La solicitud {method} {url} falló: {error}")
+        self.method = method
+        self.url = url
+
+
+def _build_session():
+    """
+    Crea una sesión HTTP con un pool de conexiones persistentes (keep-alive) y reintentos
+    ante fallos de conexión.
+
+    Retorna:
+    - requests.Session: La sesión configurada, compartida por todas las solicitudes del cliente.
+    """
+    session = requests.Session()
+    # La sesión se comparte entre casos de prueba que se ejecutan en paralelo: no se guardan las cookies recibidas,
+    # para que cada caso se envíe sin las cookies de los demás, como si usara su propia conexión
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    # Solo se reintentan los fallos de conexión; los códigos de estado se devuelven tal cual a las pruebas
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                          max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.3))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 
 class APIClient:
     """
     Clase para gestionar las solicitudes HTTP a una API externa.
-    Esta clase proporciona un método estático para enviar peticiones HTTP de forma flexible,
+    Esta clase proporciona un método de clase para enviar peticiones HTTP de forma flexible,
     permitiendo especificar el método HTTP, la URL, los encabezados, el cuerpo de la solicitud y la autenticación.
+    Todas las solicitudes comparten una misma sesión para reutilizar las conexiones TCP/TLS.
     """
 
-    @staticmethod
-    def send_request(method, url, endpoint, headers=None, body=None, auth=None):
+    DEFAULT_TIMEOUT = 30  # Tiempo máximo de espera por solicitud, en segundos
+
+    _session = _build_session()
+
+    @classmethod
+    def send_request(cls, method, url, endpoint, headers=None, body=None, auth=None, timeout=DEFAULT_TIMEOUT,
+                     stream=False):
         """
         Envía una solicitud HTTP a una API externa.
 
@@ -21,27 +71,34 @@ class APIClient:
         - headers (dict, opcional): Los encabezados HTTP que se incluirán en la solicitud. Por defecto es None.
         - body (dict, opcional): El cuerpo de la solicitud, utilizado en métodos como 'POST' o 'PUT'. Por defecto es None.
         - auth (tuple, opcional): Los detalles de autenticación en formato (usuario, contraseña). Por defecto es None.
+        - timeout (float, opcional): Tiempo máximo de espera en segundos. Por defecto es `DEFAULT_TIMEOUT`.
+        - stream (bool, opcional): Si es True, el cuerpo de la respuesta no se descarga hasta que se lee.
+          Por defecto es False.
 
         Retorna:
-        - dict: El objeto de respuesta de la solicitud. Si la solicitud es exitosa, devuelve el objeto `response`.
-        - dict: En caso de error, devuelve un diccionario con la clave 'error' y el mensaje del error.
+        - Response: El objeto de respuesta de la solicitud.
+
+        Lanza:
+        - APIClientError: Si la solicitud no puede completarse.
         """
-        try:
-            # Se forma la URL completa concatenando la URL base y el endpoint
-            full_url = f"{url}{endpoint}"
+        # Se forma la URL completa concatenando la URL base y el endpoint
+        full_url = f"{url}{endpoint}"
 
-            # Realiza la solicitud HTTP utilizando el método indicado
-            response = requests.request(
+        try:
+            # Realiza la solicitud HTTP utilizando el método indicado sobre la sesión compartida
+            response = cls._session.request(
                 method=method,  # Método HTTP (GET, POST, etc.)
                 url=full_url,  # URL completa
                 headers=headers,  # Encabezados de la solicitud, en formato JSON
                 json=body,  # Cuerpo de la solicitud, en formato JSON
                 auth=auth,  # Datos de autenticación
+                timeout=timeout,  # Evita que una solicitud bloquee la ejecución indefinidamente
+                stream=stream,  # Permite leer el cuerpo por partes en lugar de cargarlo entero en memoria
             )
 
             # Retorna la respuesta de la solicitud
             return response
 
         except RequestException as e:
-            # Si ocurre un error durante la solicitud, devuelve un diccionario con el error
-            return {"error": f"La solicitud falló: {e}"}
+            # Si ocurre un error durante la solicitud, se lanza una excepción con los datos de la solicitud
+            raise APIClientError(method, full_url, e) from e
@@ -1,4 +1,35 @@
+import logging
+import operator
 import sqlite3
+import threading
+import weakref
+
+logger = logging.getLogger(__name__)
+
+# Extraen en una sola llamada los valores de un resultado o resumen, en el orden de las columnas del INSERT
+_GET_RESULT = operator.itemgetter('TestId', 'TestCase', 'Status', 'Error', 'Method', 'URL', 'Endpoint',
+                                  'ExpectedStatusCode', 'ActualStatusCode', 'Duration', 'ResponseSize')
+_GET_SUMMARY = operator.itemgetter('TotalTests', 'PassedTests', 'FailedTests', 'AvgDuration', 'TotalResponseSize')
+
+
+def _make_inserter(conn, sql):
+    """
+    Genera una función que inserta un único resultado con la conexión y la sentencia indicadas.
+
+    La conexión, la sentencia y el extractor de valores quedan ligados como argumentos por defecto,
+    por lo que cada inserción los resuelve como variables locales sin búsquedas de atributos.
+
+    Parámetros:
+    - conn (sqlite3.Connection): Conexión sobre la que se ejecutan las inserciones.
+    - sql (str): Sentencia INSERT de la tabla 'test_results'.
+
+    Retorna:
+    - function: Función `insert(execution_id, test_result)`.
+    """
+    def insert(execution_id, test_result, _execute=conn.execute, _sql=sql, _get=_GET_RESULT):
+        _execute(_sql, (execution_id, *_get(test_result)))
+
+    return insert
 
 
 class DBManager:
@@ -7,6 +38,13 @@ class DBManager:
     Permite crear tablas, insertar resultados de pruebas y resúmenes de ejecución.
     """
 
+    # Sentencia de inserción de resultados. Se mantiene como constante para que el texto SQL sea
+    # siempre el mismo y SQLite reutilice la sentencia compilada de su caché en cada inserción
+    _INSERT_RESULT_SQL = '''INSERT INTO test_results
+                            (ExecutionId, TestId, TestCase, Status, Error, Method, URL, Endpoint,
+                             ExpectedStatusCode, ActualStatusCode, Duration, ResponseSize)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'''
+
     def __init__(self, db_file):
         """
         Inicializa la clase DBManager con el archivo de base de datos proporcionado.
@@ -15,15 +53,54 @@ class DBManager:
         - db_file (str): Ruta al archivo de base de datos SQLite que se va a utilizar.
         """
         self.db_file = db_file
+        self._conn = None  # Conexión persistente, se abre en la primera llamada a `_connect`
+        self._insert_result = None  # Función de inserción ligada a la conexión, ver `_make_inserter`
+        self._lock = threading.Lock()  # Protege la conexión si se usa desde varios hilos
+        self._finalizer = None  # Cierra la conexión, ver `_connect`
 
     def _connect(self):
         """
-        Establece una conexión con la base de datos.
+        Devuelve la conexión persistente con la base de datos, creándola si aún no existe.
+
+        La conexión se configura con modo WAL y `synchronous=NORMAL` para reducir las escrituras
+        a disco en cada commit y permitir que el reporte lea mientras se insertan resultados.
 
         Retorna:
         - conn: Conexión a la base de datos SQLite.
         """
-        return sqlite3.connect(self.db_file)
+        if self._conn is None:
+            # Se amplía la caché de sentencias compiladas del módulo `sqlite3` y, con `isolation_level=None`,
+            # no se abren transacciones implícitas; las inserciones masivas abren la suya de forma explícita
+            conn = sqlite3.connect(self.db_file, check_same_thread=False, cached_statements=256,
+                                   isolation_level=None)
+            # El tamaño de página solo tiene efecto al crear la base de datos y debe fijarse antes de activar WAL;
+            # con páginas de 8 KiB caben más filas de 'test_results' por página y los recorridos son más rápidos
+            conn.execute("PRAGMA page_size=8192")
+            # El modo WAL y el mapeo en memoria (lecturas del reporte sin llamadas al sistema) no aplican
+            # a bases de datos en memoria
+            if self.db_file != ":memory:":
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-65536")
+            self._conn = conn
+            self._insert_result = _make_inserter(conn, self._INSERT_RESULT_SQL)
+            # Garantiza que la conexión se cierre al liberar el gestor o, como tarde, al terminar el proceso;
+            # a diferencia de `atexit.register(self.close)`, no mantiene vivo al gestor hasta entonces
+            self._finalizer = weakref.finalize(self, conn.close)
+        return self._conn
+
+    def close(self):
+        """
+        Cierra la conexión persistente con la base de datos, si está abierta.
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._finalizer()  # Cierra la conexión; el finalizador ya no se vuelve a ejecutar
+                self._conn = None
+                self._insert_result = None
+                self._finalizer = None
 
     def create_tables(self):
         """
@@ -33,10 +110,10 @@ class DBManager:
         - test_results: Para almacenar los resultados de cada prueba individual.
         - test_summary: Para almacenar el resumen de la ejecución de las pruebas.
 
-        Si ocurre algún error durante la creación de las tablas, se muestra un mensaje de error.
+        Si ocurre algún error durante la creación de las tablas, se registra un mensaje de error.
         """
         try:
-            with self._connect() as conn:
+            with self._lock, self._connect() as conn:
                 c = conn.cursor()
 
                 # Creación de la tabla 'test_executions'
@@ -65,6 +142,14 @@ class DBManager:
                             FOREIGN KEY (ExecutionId) REFERENCES test_executions(ExecutionId)
                         )''')
 
+                # Índices sobre 'test_results' para las consultas por ejecución y para los resúmenes de una
+                # ejecución; este último incluye todas las columnas que usan los resúmenes, de modo que se
+                # calculan sin leer la tabla
+                c.execute('''CREATE INDEX IF NOT EXISTS idx_test_results_execution
+                            ON test_results(ExecutionId)''')
+                c.execute('''CREATE INDEX IF NOT EXISTS idx_test_results_summary
+                            ON test_results(ExecutionId, Status, Duration, ResponseSize)''')
+
                 # Creación de la tabla 'test_summary'
                 c.execute('''CREATE TABLE IF NOT EXISTS test_summary (
                             ExecutionId INTEGER PRIMARY KEY,
@@ -77,7 +162,7 @@ class DBManager:
                         )''')
 
         except Exception as e:
-            print(f"Error al crear las tablas: {e}")
+            logger.warning("Error al crear las tablas: %s", e)
 
     def insert_test_result(self, execution_id, test_result):
         """
@@ -89,22 +174,35 @@ class DBManager:
           Debe tener las claves: 'TestId', 'TestCase', 'Status', 'Error', 'Method', 'URL',
           'Endpoint', 'ExpectedStatusCode', 'ActualStatusCode', 'Duration', 'ResponseSize'.
 
-        Si ocurre algún error durante la inserción, se muestra un mensaje de error.
+        Si ocurre algún error durante la inserción, se registra un mensaje de error.
         """
         try:
-            with self._connect() as conn:
-                c = conn.cursor()
-                c.execute('''INSERT INTO test_results
-                            (ExecutionId, TestId, TestCase, Status, Error, Method, URL, Endpoint,
-                             ExpectedStatusCode, ActualStatusCode, Duration, ResponseSize)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
-                          (execution_id, test_result['TestId'], test_result['TestCase'],
-                           test_result['Status'], test_result['Error'], test_result['Method'],
-                           test_result['URL'], test_result['Endpoint'], test_result['ExpectedStatusCode'],
-                           test_result['ActualStatusCode'], test_result['Duration'],
-                           test_result['ResponseSize']))
+            with self._lock:
+                self._connect()
+                self._insert_result(execution_id, test_result)
+        except Exception as e:
+            logger.warning("Error al insertar el resultado de la prueba: %s", e)
+
+    def insert_test_results(self, execution_id, test_results):
+        """
+        Inserta varios resultados de prueba en la tabla 'test_results' dentro de una única transacción.
+
+        Parámetros:
+        - execution_id (int): ID de la ejecución de la prueba correspondiente.
+        - test_results (list): Lista de diccionarios con los resultados de las pruebas.
+          Cada uno debe tener las mismas claves que en `insert_test_result`.
+
+        Si ocurre algún error durante la inserción, se registra un mensaje de error.
+        """
+        try:
+            with self._lock, self._connect() as conn:
+                # Se reserva el bloqueo de escritura desde el inicio para todo el lote; el bloque `with`
+                # confirma la transacción al terminar o la revierte si ocurre un error
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(self._INSERT_RESULT_SQL,
+                                 ((execution_id, *_GET_RESULT(r)) for r in test_results))
         except Exception as e:
-            print(f"Error al insertar el resultado de la prueba: {e}")
+            logger.warning("Error al insertar los resultados de las pruebas: %s", e)
 
     def insert_test_summary(self, execution_id, summary):
         """
@@ -115,18 +213,53 @@ class DBManager:
         - summary (dict): Diccionario que contiene el resumen de la ejecución.
           Debe tener las claves: 'TotalTests', 'PassedTests', 'FailedTests', 'AvgDuration', 'TotalResponseSize'.
 
-        Si ocurre algún error durante la inserción, se muestra un mensaje de error.
+        Si ocurre algún error durante la inserción, se registra un mensaje de error.
         """
         try:
-            with self._connect() as conn:
+            with self._lock, self._connect() as conn:
                 c = conn.cursor()
                 c.execute('''INSERT INTO test_summary
                             (ExecutionId, TotalTests, PassedTests, FailedTests, AvgDuration, TotalResponseSize)
                             VALUES (?, ?, ?, ?, ?, ?)''',
-                          (execution_id, summary['TotalTests'], summary['PassedTests'], summary['FailedTests'],
-                           summary['AvgDuration'], summary['TotalResponseSize']))
+                          (execution_id, *_GET_SUMMARY(summary)))
+        except Exception as e:
+            logger.warning("Error al insertar el resumen de la prueba: %s", e)
+
+    def finalize_summary(self, execution_id):
+        """
+        Calcula el resumen de una ejecución directamente en SQLite a partir de sus registros en
+        'test_results' y lo inserta en la tabla 'test_summary' con una única sentencia.
+
+        Parámetros:
+        - execution_id (int): ID de la ejecución de las pruebas correspondiente.
+
+        Retorna:
+        - dict: El resumen insertado, con las claves 'TotalTests', 'PassedTests', 'FailedTests', 'SkippedTests',
+          'AvgDuration' y 'TotalResponseSize', o None en caso de error.
+        """
+        try:
+            with self._lock, self._connect() as conn:
+                c = conn.cursor()
+                c.execute('''INSERT INTO test_summary
+                            (ExecutionId, TotalTests, PassedTests, FailedTests, AvgDuration, TotalResponseSize)
+                            SELECT ?, COUNT(*), COALESCE(SUM(Status = 'PASSED'), 0),
+                                   COALESCE(SUM(Status = 'FAILED'), 0), COALESCE(AVG(Duration), 0),
+                                   COALESCE(SUM(ResponseSize), 0)
+                            FROM test_results WHERE ExecutionId = ?
+                            RETURNING TotalTests, PassedTests, FailedTests, AvgDuration, TotalResponseSize''',
+                          (execution_id, execution_id))
+                total, passed, failed, avg_duration, total_response_size = c.fetchall()[0]
+                return {
+                    "TotalTests": total,
+                    "PassedTests": passed,
+                    "FailedTests": failed,
+                    "SkippedTests": total - passed - failed,  # El resto de pruebas son las saltadas
+                    "AvgDuration": avg_duration,
+                    "TotalResponseSize": total_response_size,
+                }
         except Exception as e:
-            print(f"Error al insertar el resumen de la prueba: {e}")
+            logger.warning("Error al generar el resumen de la prueba: %s", e)
+            return None
 
     def insert_test_execution(self, execution_name):
         """
@@ -139,10 +272,10 @@ class DBManager:
         - int: El ID de la ejecución insertada si la operación es exitosa, o None en caso de error.
         """
         try:
-            with self._connect() as conn:
+            with self._lock, self._connect() as conn:
                 c = conn.cursor()
                 c.execute('''INSERT INTO test_executions (ExecutionName) VALUES (?)''', (execution_name,))
                 return c.lastrowid  # Retorna el ID de la última fila insertada (ID de la ejecución)
         except Exception as e:
-            print(f"Error al insertar la ejecución de la prueba: {e}")
+            logger.warning("Error al insertar la ejecución de la prueba: %s", e)
             return None
@@ -1,7 +1,62 @@
-import pandas as pd
-import json
+import copy
+import logging
+import operator
+from functools import lru_cache
+import orjson
+from pydantic import TypeAdapter, ValidationError
+from python_calamine import CalamineWorkbook
 from core.test_data_model import APIData
 
+logger = logging.getLogger(__name__)
+
+# Campos del modelo `APIData`; el resto de columnas de la hoja se ignoran al leerla
+_FIELDS = frozenset(APIData.model_fields)
+
+# Validador de listas completas de registros, para validar toda la hoja en una única llamada
+_ADAPTER = TypeAdapter(list[APIData])
+
+# Columnas de la hoja 'TestSuite' que contienen JSON y se convierten a diccionarios; 'ExpectedResponse' también
+# contiene JSON, pero se convierte aparte con `_convert_expected_response`
+_JSON_COLUMNS = ('Headers', 'Body')
+
+# Valores de celda que se interpretan directamente como un diccionario vacío
+_EMPTY_JSON_VALUES = frozenset(('', '{}', 'null', 'None'))
+
+# Valores de celda que indican que el caso de prueba no define una respuesta esperada
+_NO_EXPECTED_RESPONSE_VALUES = frozenset(('', 'null', 'None'))
+
+
+def _to_str(value):
+    """
+    Convierte el valor de una celda a cadena. Los números enteros que la hoja almacena como
+    decimales (por ejemplo, `1.0`) se convierten sin la parte decimal.
+
+    Parámetros:
+    - value: Valor de la celda.
+
+    Retorna:
+    - str: El valor convertido a cadena.
+    """
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+@lru_cache(maxsize=512)
+def _parse_cached(value):
+    """
+    Convierte una cadena JSON con `orjson`, guardando el resultado en caché. Las filas de una
+    misma hoja suelen repetir los mismos encabezados o cuerpos, que así solo se analizan una vez.
+
+    Parámetros:
+    - value (str): Cadena JSON a convertir.
+
+    Retorna:
+    - El objeto resultante de la conversión. No debe modificarse, ya que se comparte entre llamadas; ver
+      `_convert_to_dict`, que solo copia su primer nivel.
+    """
+    return orjson.loads(value)
+
 
 def _convert_to_dict(value):
     """
@@ -14,38 +69,40 @@ def _convert_to_dict(value):
     Retorna:
     - dict: El diccionario resultante si la conversión es exitosa, o un diccionario vacío en caso de error o si la cadena está vacía.
     """
-    if isinstance(value, str) and value:
-        try:
-            # Si la cadena no es '{}' (un diccionario vacío), la intentamos convertir
-            if value != '{}':
-                return json.loads(value)
-            else:
-                return {}
-        except json.JSONDecodeError:
-            # Si ocurre un error en la conversión, imprimimos un mensaje de error
-            print(f"Error al convertir la cadena a diccionario: {value}")
-            return {}
-    return {}
-
-
-def _validate(record):
+    if not isinstance(value, str):
+        return {}
+
+    # Las celdas vacías o con valores que representan un diccionario vacío no pasan por el analizador JSON
+    value = value.strip()
+    if value in _EMPTY_JSON_VALUES:
+        return {}
+
+    try:
+        # Se devuelve una copia superficial: cada registro puede añadir o sustituir claves de primer nivel (por
+        # ejemplo, las pruebas añaden el encabezado 'Authorization'), pero los diccionarios y listas anidados se
+        # comparten con la caché y con el resto de filas que usan la misma cadena, por lo que no deben modificarse
+        return copy.copy(_parse_cached(value))
+    except orjson.JSONDecodeError:
+        # Si ocurre un error en la conversión, registramos un mensaje de error
+        logger.warning("Error al convertir la cadena a diccionario: %s", value)
+        return {}
+
+
+def _convert_expected_response(value):
     """
-    Valida un registro utilizando el modelo `APIData`. Si el registro no es válido, se captura la excepción y se imprime un error.
+    Convierte la respuesta esperada de un caso de prueba a un diccionario. Si la celda está vacía o no existe,
+    devuelve None: el caso no define una respuesta esperada y solo se comprueba su código de estado. Un `{}`
+    explícito se convierte en un diccionario vacío, de modo que se sigue comparando con la respuesta obtenida.
 
     Parámetros:
-    - record (dict): Registro a validar.
+    - value: Valor de la celda 'ExpectedResponse', o None si la hoja no tiene esa columna.
 
     Retorna:
-    - bool: `True` si el registro es válido según el modelo `APIData`, `False` en caso contrario.
+    - dict or None: El diccionario resultante, o None si no hay respuesta esperada.
     """
-    try:
-        # Se valida el registro creando una instancia de APIData
-        APIData(**record)
-        return True
-    except Exception as e:
-        # Si ocurre un error de validación, imprimimos el mensaje de error
-        print(f"Validation error: {e}")
-        return False
+    if value is None or (isinstance(value, str) and value.strip() in _NO_EXPECTED_RESPONSE_VALUES):
+        return None
+    return _convert_to_dict(value)
 
 
 class ExcelReader:
@@ -65,38 +122,84 @@ class ExcelReader:
         """
         self.file_path = file_path
 
-    def load_data(self):
+    def _iter_records(self):
         """
-        Lee los datos del archivo de Excel y los procesa para convertirlos en registros válidos.
+        Recorre las filas de la hoja 'TestSuite' y genera un diccionario por cada fila no vacía.
+
+        Las filas se leen directamente del archivo con calamine, sin construir un DataFrame intermedio.
+        La columna 'TestId' se convierte a cadena y las columnas JSON a diccionarios; una respuesta esperada vacía
+        o ausente se deja como None.
 
         Retorna:
-        - list: Una lista de instancias de `APIData` que representan los registros válidos de la hoja de Excel.
-        Si ocurre un error durante la carga o procesamiento de los datos, retorna una lista vacía.
+        - generator: Un generador de diccionarios con los campos de `APIData`, aún sin validar.
         """
-        try:
-            # Leemos la hoja 'TestSuite' del archivo de Excel
-            df = pd.read_excel(self.file_path, sheet_name="TestSuite")
+        rows = CalamineWorkbook.from_path(self.file_path).get_sheet_by_name("TestSuite").iter_rows()
+
+        # La primera fila contiene los nombres de las columnas; solo se leen las que forman parte de `APIData`
+        header = next(rows, [])
+        columns = [(index, name) for index, name in enumerate(header) if name in _FIELDS]
+        names = [name for _, name in columns]
+
+        # Los valores de cada fila se extraen en una sola llamada a `itemgetter`, que solo devuelve
+        # una tupla cuando recibe más de un índice
+        if len(columns) == 1:
+            index = columns[0][0]
+
+            def get_values(row):
+                return (row[index],)
+        else:
+            get_values = operator.itemgetter(*(index for index, _ in columns))
 
-            # Rellenamos valores nulos con cadenas vacías
-            df = df.fillna('')
+        for row in rows:
+            if not any(value != '' for value in row):
+                continue
 
-            # Convertimos la columna 'TestId' a tipo string
-            df['TestId'] = df['TestId'].apply(str)
+            record = dict(zip(names, get_values(row)))
 
-            # Convertimos las columnas 'Headers', 'Body', y 'ExpectedResponse' de JSON a diccionarios
-            df['Headers'] = df['Headers'].apply(_convert_to_dict)
-            df['Body'] = df['Body'].apply(_convert_to_dict)
-            df['ExpectedResponse'] = df['ExpectedResponse'].apply(_convert_to_dict)
+            # Convertimos 'TestId' a tipo string y las columnas JSON a diccionarios
+            record['TestId'] = _to_str(record['TestId'])
+            for column in _JSON_COLUMNS:
+                record[column] = _convert_to_dict(record.get(column))
+            record['ExpectedResponse'] = _convert_expected_response(record.get('ExpectedResponse'))
 
-            # Convertimos el DataFrame a una lista de diccionarios
-            records = df.to_dict(orient="records")
+            yield record
 
-            # Validamos los registros y los convertimos en instancias de APIData
-            validated_data = [APIData(**record) for record in records if _validate(record)]
+    def load_data(self):
+        """
+        Lee los datos del archivo de Excel y los procesa para convertirlos en registros válidos.
 
-            return validated_data
+        Todos los registros se validan en una única llamada a `pydantic`. Si alguno no es válido, se vuelven
+        a validar uno a uno para descartar solo los registros con errores.
+
+        Retorna:
+        - list: Una lista de instancias de `APIData` que representan los registros válidos de la hoja de Excel.
+        Si ocurre un error durante la carga o procesamiento de los datos, retorna una lista vacía.
+        """
+        try:
+            records = list(self._iter_records())
+            try:
+                return _ADAPTER.validate_python(records)
+            except ValidationError:
+                return list(self._validate_each(records))
 
         except Exception as e:
-            # Si ocurre un error durante la lectura del archivo de Excel, lo imprimimos
-            print(f"Error al leer el archivo de Excel: {e}")
+            # Si ocurre un error durante la lectura del archivo de Excel, lo registramos
+            logger.warning("Error al leer el archivo de Excel: %s", e)
             return []
+
+    @staticmethod
+    def _validate_each(records):
+        """
+        Valida los registros uno a uno, descartando los que no son válidos y registrando su error.
+
+        Parámetros:
+        - records (iterable): Registros a validar.
+
+        Retorna:
+        - generator: Un generador de instancias de `APIData` para los registros válidos.
+        """
+        for record in records:
+            try:
+                yield APIData.model_validate(record)
+            except ValidationError as e:
+                logger.warning("Validation error: %s", e)
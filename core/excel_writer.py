@@ -1,58 +1,49 @@
+import os
 from openpyxl import load_workbook
-from openpyxl.styles import PatternFill, Font, Border, Side, Alignment
+from openpyxl.styles import PatternFill, Font, Alignment
 from datetime import datetime
+from core import fast_xlsx
 
 
-def _copy_worksheet(wb, source_sheet_name, new_sheet_name):
-    """
-    Copia una hoja de trabajo existente en el libro de trabajo y le da un nuevo nombre.
+# Encabezados de las columnas del archivo de registro de cada ejecución (inmutables, se crean una sola vez)
+_LOG_HEADERS = (
+    "TestId", "TestCase", "Status", "Error", "Method", "URL",
+    "Endpoint", "ExpectedStatusCode", "ActualStatusCode",
+    "Duration", "ResponseSize"
+)
+
+# Formato de los estados que no llevan mensaje de error; cualquier otro estado se trata como fallido
+_STATUS_FORMATS = {
+    "SKIPPED": ("SKIPPED", "FFFF00", None),
+    "PASSED": ("PASSED", "00FF00", None),
+}
 
-    Parámetros:
-    - wb (Workbook): El objeto de libro de trabajo de `openpyxl`.
-    - source_sheet_name (str): El nombre de la hoja fuente que se va a copiar.
-    - new_sheet_name (str): El nuevo nombre que se le asignará a la hoja copiada.
+
+def _log_sheet_name():
+    """
+    Genera el nombre de la hoja de registro a partir de la fecha y hora actual.
 
     Retorna:
-    - Worksheet: La nueva hoja de trabajo copiada, o None si la hoja fuente no existe.
+    - str: El nombre de la hoja, con el formato 'TestCases_<fecha>'.
     """
-    if source_sheet_name not in wb.sheetnames:
-        print(f"No se encontró la hoja fuente: {source_sheet_name}")
-        return None
-    source_sheet = wb[source_sheet_name]
-    new_sheet = wb.copy_worksheet(source_sheet)
-    new_sheet.title = new_sheet_name
-    return new_sheet
+    current_date = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    return f"TestCases_{current_date}"
 
 
-def _create_new_sheet_with_date(wb):
+def _build_row_index(ws):
     """
-    Crea una nueva hoja de trabajo con un nombre basado en la fecha y hora actual.
+    Construye un índice de las filas de la hoja por TestId, recorriendo una única vez la primera columna.
 
     Parámetros:
-    - wb (Workbook): El objeto de libro de trabajo de `openpyxl`.
+    - ws (Worksheet): La hoja de trabajo a indexar.
 
     Retorna:
-    - Worksheet: La nueva hoja de trabajo con el nombre basado en la fecha.
+    - dict: Un diccionario que asocia cada TestId con la lista de números de fila en los que aparece.
     """
-    current_date = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    sheet_name = f"TestCases_{current_date}"
-
-    # Si la hoja con ese nombre ya existe, la obtenemos, si no la creamos
-    if sheet_name in wb.sheetnames:
-        ws = wb[sheet_name]
-    else:
-        ws = wb.create_sheet(sheet_name)
-
-    # Definimos los encabezados de las columnas
-    headers = [
-        "TestId", "TestCase", "Status", "Error", "Method", "URL",
-        "Endpoint", "ExpectedStatusCode", "ActualStatusCode",
-        "Duration", "ResponseSize"
-    ]
-    # Insertamos los encabezados en la primera fila
-    ws.append(headers)
-
-    return ws
+    row_index = {}
+    for (cell,) in ws.iter_rows(min_row=2, max_col=1):
+        row_index.setdefault(cell.value, []).append(cell.row)
+    return row_index
 
 
 def _format_error_message(error_message):
@@ -83,12 +74,10 @@ def _get_status_format(status, error_message):
     Retorna:
     - tuple: Una tupla con el estado formateado, el color y el mensaje de error (si aplica).
     """
-    if status == "SKIPPED":
-        return ("SKIPPED", "FFFF00", None)
-    elif status == "PASSED":
-        return ("PASSED", "00FF00", None)
-    else:
-        return ("FAILED", "FF0000", _format_error_message(error_message))
+    status_format = _STATUS_FORMATS.get(status)
+    if status_format:
+        return status_format
+    return ("FAILED", "FF0000", _format_error_message(error_message))
 
 
 class ExcelWriter:
@@ -96,21 +85,22 @@ class ExcelWriter:
     Clase para escribir y actualizar resultados de pruebas en un archivo Excel usando la librería `openpyxl`.
     """
 
-    def __init__(self, file_path):
+    def __init__(self, file_path, reports_dir="reports"):
         """
         Inicializa la clase ExcelWriter con la ruta del archivo Excel.
 
         Parámetros:
         - file_path (str): Ruta del archivo Excel donde se escribirán los resultados.
+        - reports_dir (str, opcional): Directorio donde se guardan los archivos de registro de cada ejecución.
+          Por defecto es 'reports'.
         """
         self.file_path = file_path
-        # Definimos un borde fino para aplicar a las celdas
-        self.thin_border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin")
-        )
+        self.reports_dir = reports_dir
+        # Estilos de las celdas de estado y error, creados una sola vez y compartidos por todas las filas
+        self._fills = {color: PatternFill(start_color=color, fill_type="solid")
+                       for color in ("00FF00", "FF0000", "FFFF00")}
+        self._font_black = Font(color="000000")  # Fuente de color negro
+        self._wrap = Alignment(wrap_text=True)  # Ajusta el texto para que se muestre en varias líneas
 
     def _apply_format_to_row(self, row, status, color, error_message):
         """
@@ -127,64 +117,98 @@ class ExcelWriter:
         error_cell = row[14]  # Columna de error (15ª columna)
 
         status_cell.value = status
-        status_cell.fill = PatternFill(start_color=color, fill_type="solid")
-        status_cell.font = Font(color="000000")  # Fuente de color negro
+        status_cell.fill = self._fills[color]
+        status_cell.font = self._font_black
 
         # Asignamos el mensaje de error y configuramos la alineación
         error_cell.value = error_message
-        error_cell.alignment = Alignment(
-            wrap_text=True)  # Ajusta el texto para que se muestre en varias líneas si es necesario
-
-        # Aplicamos un borde fino a todas las celdas de la fila
-        for cell in row:
-            cell.border = self.thin_border
+        error_cell.alignment = self._wrap
 
-    def _update_row(self, ws, result):
+    def _update_row(self, ws, result, row_index, max_col):
         """
         Actualiza una fila de la hoja de trabajo con los resultados de la prueba.
 
         Parámetros:
         - ws (Worksheet): La hoja de trabajo donde se actualizarán los resultados.
         - result (dict): Diccionario con los resultados de la prueba a actualizar.
+        - row_index (dict): Índice de las filas de la hoja por TestId, generado con `_build_row_index`.
+        - max_col (int): Número de columnas de la fila que se actualizan.
         """
-        for row in ws.iter_rows(min_row=2, max_col=ws.max_column - 1):
-            if row[0].value == result["TestId"]:  # Compara el TestId para encontrar la fila correspondiente
+        rows = row_index.get(result["TestId"])
+        if not rows:
+            return
+
+        status, color, error_message = _get_status_format(result["Status"], result.get("Error"))
+        for row_number in rows:
+            self._apply_format_to_row(ws[row_number][:max_col], status, color, error_message)
+
+    def _write_results_log(self, results, execution_name):
+        """
+        Escribe los resultados de la ejecución en un nuevo archivo Excel de registro.
+
+        El archivo se genera con `fast_xlsx`, que escribe el XML de la hoja fila a fila sin construir
+        ningún modelo de objetos de `openpyxl`.
+
+        Parámetros:
+        - results (list): Lista de diccionarios con los resultados de las pruebas.
+        - execution_name (str): Nombre de la ejecución, utilizado como nombre del archivo.
+
+        Retorna:
+        - str: La ruta del archivo de registro generado.
+        """
+        def rows():
+            yield _LOG_HEADERS
+            for result in results:
                 status, color, error_message = _get_status_format(result["Status"], result.get("Error"))
-                self._apply_format_to_row(row, status, color, error_message)
+                yield [
+                    result["TestId"], result["TestCase"],
+                    fast_xlsx.StyledValue(status, fast_xlsx.fill_style(color)),
+                    fast_xlsx.StyledValue(error_message, fast_xlsx.STYLE_WRAP),
+                    result["Method"], result["URL"], result["Endpoint"], result["ExpectedStatusCode"],
+                    result["ActualStatusCode"], result["Duration"], result["ResponseSize"]
+                ]
+
+        os.makedirs(self.reports_dir, exist_ok=True)
+        log_path = os.path.join(self.reports_dir, f"{execution_name}.xlsx")
+        fast_xlsx.write_sheet(log_path, _log_sheet_name(), rows())
+        return log_path
 
     def update_results(self, results, execution_name):
         """
-        Actualiza los resultados de las pruebas en el archivo Excel, tanto en la hoja principal como en una nueva hoja de registro.
+        Actualiza los resultados de las pruebas en la hoja principal del archivo Excel y los registra
+        en un nuevo archivo de la ejecución dentro de `reports_dir`.
+
+        El archivo debe ser un xlsx simple: las macros y los vínculos externos no se cargan ni se conservan.
 
         Parámetros:
         - results (list): Lista de diccionarios con los resultados de las pruebas a actualizar.
+        - execution_name (str): Nombre de la ejecución, utilizado como nombre del archivo de registro.
         """
         try:
             if not results:
                 print("No hay resultados para actualizar.")
                 return
 
-            wb = load_workbook(self.file_path)
+            # El archivo de pruebas es un xlsx simple: no se cargan macros ni vínculos externos
+            wb = load_workbook(self.file_path, keep_vba=False, keep_links=False, data_only=False)
 
             # Comprobamos si la hoja principal 'TestSuite' existe
             if "TestSuite" in wb.sheetnames:
                 main_sheet = wb["TestSuite"]
-                # Actualizamos cada fila con los resultados proporcionados
+                # Indexamos las filas por TestId y actualizamos cada fila con los resultados proporcionados
+                row_index = _build_row_index(main_sheet)
+                max_col = main_sheet.max_column - 1  # Se calcula una sola vez para todas las filas
                 for result in results:
-                    self._update_row(main_sheet, result)
+                    self._update_row(main_sheet, result, row_index, max_col)
             else:
                 print("No se encontró la hoja principal 'TestSuite'. No se realizaron actualizaciones.")
                 return
 
-            # Copiamos la hoja 'TestSuite' y la renombramos con la marca de tiempo
-            new_sheet = _copy_worksheet(wb, "TestSuite", execution_name)
-            if new_sheet:
-                # Actualizamos los resultados en la nueva hoja
-                for result in results:
-                    self._update_row(new_sheet, result)
-
             # Guardamos el archivo Excel con las actualizaciones
             wb.save(self.file_path)
-            print(f"Resultados actualizados en 'TestSuite' y en la nueva hoja '{execution_name}'.")
+
+            # Registramos los resultados de la ejecución en su propio archivo
+            log_path = self._write_results_log(results, execution_name)
+            print(f"Resultados actualizados en 'TestSuite' y registrados en '{log_path}'.")
         except Exception as e:
             print(f"Error actualizando el archivo Excel: {e}")
@@ -0,0 +1,176 @@
+import re
+import zipfile
+from collections import namedtuple
+from xml.sax.saxutils import escape, quoteattr
+
+# Valor de celda con un estilo asociado; el estilo es uno de los índices definidos más abajo
+StyledValue = namedtuple("StyledValue", ["value", "style"])
+
+# Índices de los estilos definidos en `_STYLES_XML` (0 es el estilo por defecto)
+_FILL_STYLES = {"00FF00": 1, "FF0000": 2, "FFFF00": 3}
+STYLE_WRAP = 4
+
+# Caracteres de control que no están permitidos en XML (los mismos que rechaza `openpyxl`)
+_ILLEGAL_CHARACTERS_RE = re.compile(r"[\000-\010]|[\013-\014]|[\016-\037]")
+
+_CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+
+_ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+_WORKBOOK_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+_WORKBOOK_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name={name} sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+# Estilos: 1-3 son los rellenos de estado (verde, rojo, amarillo) con fuente negra y 4 ajusta el texto
+_STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="2">'
+    '<font><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    '<font><color rgb="00000000"/><sz val="11"/><name val="Calibri"/><family val="2"/></font>'
+    '</fonts>'
+    '<fills count="5">'
+    '<fill><patternFill/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="0000FF00"/><bgColor rgb="00000000"/></patternFill></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="00FF0000"/><bgColor rgb="00000000"/></patternFill></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="00FFFF00"/><bgColor rgb="00000000"/></patternFill></fill>'
+    '</fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="5">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="2" borderId="0" xfId="0" applyFont="1" applyFill="1"/>'
+    '<xf numFmtId="0" fontId="1" fillId="3" borderId="0" xfId="0" applyFont="1" applyFill="1"/>'
+    '<xf numFmtId="0" fontId="1" fillId="4" borderId="0" xfId="0" applyFont="1" applyFill="1"/>'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0" applyAlignment="1">'
+    '<alignment wrapText="1"/></xf>'
+    '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+_SHEET_HEADER_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_FOOTER_XML = '</sheetData></worksheet>'
+
+
+def fill_style(color):
+    """
+    Devuelve el índice del estilo con el relleno del color indicado y fuente negra.
+
+    Parámetros:
+    - color (str): Color en formato hexadecimal RGB ("00FF00", "FF0000" o "FFFF00").
+
+    Retorna:
+    - int: El índice del estilo.
+    """
+    return _FILL_STYLES[color]
+
+
+def _column_letter(index):
+    """
+    Convierte un índice de columna (empezando en 0) en su letra de Excel (A, B, ..., Z, AA, ...).
+
+    Parámetros:
+    - index (int): Índice de la columna.
+
+    Retorna:
+    - str: La letra de la columna.
+    """
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _cell_xml(reference, value, style):
+    """
+    Genera el XML de una celda.
+
+    Parámetros:
+    - reference (str): Referencia de la celda (por ejemplo, 'A1').
+    - value: Valor de la celda. Los números se escriben como números y el resto como texto.
+    - style (int): Índice del estilo de la celda (0 para el estilo por defecto).
+
+    Retorna:
+    - str: El XML de la celda.
+    """
+    style_attr = f' s="{style}"' if style else ""
+    if value is None:
+        return f'<c r="{reference}"{style_attr}/>' if style else ""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f'<c r="{reference}"{style_attr}><v>{value!r}</v></c>'
+    text = escape(_ILLEGAL_CHARACTERS_RE.sub("", str(value)))
+    return f'<c r="{reference}"{style_attr} t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def write_sheet(path, sheet_name, rows):
+    """
+    Genera un archivo xlsx con una única hoja escribiendo su XML directamente, sin pasar por el modelo
+    de objetos de una librería de hojas de cálculo.
+
+    Parámetros:
+    - path (str): Ruta del archivo xlsx a generar.
+    - sheet_name (str): Nombre de la hoja.
+    - rows (iterable): Filas a escribir, cada una una secuencia de valores. Un valor puede ser un
+      `StyledValue` para aplicarle uno de los estilos del módulo.
+    """
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", _CONTENT_TYPES_XML)
+        zf.writestr("_rels/.rels", _ROOT_RELS_XML)
+        zf.writestr("xl/workbook.xml", _WORKBOOK_XML.format(name=quoteattr(sheet_name)))
+        zf.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS_XML)
+        zf.writestr("xl/styles.xml", _STYLES_XML)
+
+        # La hoja se escribe fila a fila directamente en el archivo comprimido
+        with zf.open("xl/worksheets/sheet1.xml", "w") as sheet:
+            sheet.write(_SHEET_HEADER_XML.encode())
+            for row_number, row in enumerate(rows, start=1):
+                cells = []
+                for column, value in enumerate(row):
+                    style = 0
+                    if isinstance(value, StyledValue):
+                        value, style = value
+                    cells.append(_cell_xml(f"{_column_letter(column)}{row_number}", value, style))
+                sheet.write(f'<row r="{row_number}">{"".join(cells)}</row>'.encode())
+            sheet.write(_SHEET_FOOTER_XML.encode())
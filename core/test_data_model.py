@@ -1,5 +1,5 @@
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class APIData(BaseModel):
@@ -10,6 +10,10 @@ class APIData(BaseModel):
     estén presentes con los tipos correctos. Además, proporciona validación automática de los datos.
     """
 
+    # Las columnas adicionales de la hoja se ignoran y los campos no se vuelven a validar al asignarlos
+    # (las pruebas modifican los encabezados de cada caso al preparar la solicitud)
+    model_config = ConfigDict(extra='ignore', validate_assignment=False, revalidate_instances='never')
+
     TestId: str
     """
     Identificador único de la prueba.
@@ -1,11 +1,17 @@
+import orjson
 import pytest
 import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.exceptions import RequestException
 import config
 from core.api_client import APIClient
 from core.db_manager import DBManager
 from core.excel_reader import ExcelReader
 from core.excel_writer import ExcelWriter
 
+# Tamaño de los bloques en los que se lee el cuerpo de las respuestas que no se guardan en memoria
+RESPONSE_CHUNK_SIZE = 64 * 1024
+
 
 @pytest.fixture(scope="module")
 def test_data():
@@ -64,8 +70,13 @@ def send_request_and_measure_time(client, test_case, headers, auth):
 
     Returns:
         tuple: La respuesta de la API, el tiempo de duración de la solicitud y el tamaño de la respuesta.
+
+    Solo se guarda en memoria el cuerpo de los casos de prueba que definen una respuesta esperada, ya que es
+    necesario para compararla. En el resto, su tamaño se toma del encabezado `Content-Length` o se cuenta
+    leyéndolo por partes. En ambos casos el tamaño es el del cuerpo descomprimido.
     """
-    start_time = time.time()  # Captura el tiempo antes de la solicitud
+    stream = test_case.ExpectedResponse is None  # El cuerpo solo se necesita si se va a comparar
+    start_time = time.perf_counter()  # Captura el tiempo antes de la solicitud (reloj monotónico)
     try:
         # Realiza la solicitud HTTP usando los parámetros proporcionados
         response = client.send_request(
@@ -74,18 +85,72 @@ def send_request_and_measure_time(client, test_case, headers, auth):
             test_case.Endpoint,
             headers=headers,
             body=test_case.Body,
-            auth=auth
+            auth=auth,
+            stream=stream
         )
-    except Exception as e:
+        if stream:
+            response_size = read_response_size(response)
+        else:
+            # El cuerpo se va a comparar, así que se descarga entero una única vez; su tamaño es la longitud de esos
+            # mismos bytes (ya descomprimidos, como en `read_response_size`), sin decodificarlos a texto
+            response_size = len(response.content)
+    except RequestException as e:
         pytest.fail(f"API request failed: {e}")  # Si hay un error, falla el test
 
-    end_time = time.time()  # Captura el tiempo después de la solicitud
+    end_time = time.perf_counter()  # Captura el tiempo después de la solicitud
     duration = end_time - start_time  # Calcula la duración de la solicitud
-    response_size = len(response.text)  # Calcula el tamaño de la respuesta
 
     return response, duration, response_size
 
 
+def read_response_size(response):
+    """
+    Obtiene el tamaño del cuerpo de una respuesta descargada en modo `stream` sin guardarlo en memoria.
+
+    Se usa el encabezado `Content-Length` cuando el cuerpo no está comprimido, ya que entonces coincide con su
+    tamaño; en otro caso, el cuerpo se lee por partes y se suman sus longitudes. En ambos casos el cuerpo se
+    consume por completo para que la conexión pueda reutilizarse.
+
+    Args:
+        response (Response): Respuesta de la API obtenida con `stream=True`.
+
+    Returns:
+        int: El tamaño del cuerpo de la respuesta en bytes.
+    """
+    content_length = response.headers.get("Content-Length")
+    # Las respuestas a HEAD anuncian el tamaño del cuerpo pero no lo incluyen
+    if content_length and "Content-Encoding" not in response.headers and response.request.method != "HEAD":
+        response.raw.drain_conn()  # Descarta el cuerpo y devuelve la conexión al pool
+        response.close()
+        return int(content_length)
+    response_size = sum(len(chunk) for chunk in response.iter_content(chunk_size=RESPONSE_CHUNK_SIZE))
+    response.close()
+    return response_size
+
+
+def parse_response_body(response):
+    """
+    Obtiene el cuerpo de la respuesta: como objeto de Python si es JSON o como texto en otro caso.
+    El JSON se interpreta con `orjson`, que es bastante más rápido que el decodificador de la librería estándar.
+
+    Args:
+        response (Response): Respuesta de la API obtenida.
+
+    Returns:
+        dict, list or str: El cuerpo de la respuesta interpretado.
+
+    Raises:
+        ValueError: Si el cuerpo no es un JSON válido.
+    """
+    if 'application/json' not in response.headers.get('Content-Type', ''):
+        return response.text
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        # `orjson` solo admite UTF-8; los cuerpos con otra codificación se decodifican como antes
+        return response.json()
+
+
 def check_response(response, test_case):
     """
     Verifica la respuesta de la API comparando el código de estado y el cuerpo de la respuesta con las expectativas.
@@ -106,10 +171,14 @@ def check_response(response, test_case):
         status = "FAILED"
         error = f"Expected status code: {test_case.ExpectedStatusCode}, Got: {response.status_code}"
 
+    # El cuerpo solo se analiza y compara si el caso de prueba define una respuesta esperada; si no, ya se ha
+    # descartado sin leerlo al medir su tamaño
+    if test_case.ExpectedResponse is None:
+        return status, error
+
     try:
         # Compara la respuesta con la esperada
-        response_body = response.json() if 'application/json' in response.headers.get('Content-Type',
-                                                                                      '') else response.text
+        response_body = parse_response_body(response)
         if response_body != test_case.ExpectedResponse:
             status = "FAILED"
             error = f"Expected response: {test_case.ExpectedResponse}, Got: {response_body}"
@@ -120,12 +189,66 @@ def check_response(response, test_case):
     return status, error
 
 
+def build_result(test_case, status, error, actual_status_code=None, duration=None, response_size=None):
+    """
+    Construye el diccionario con el resultado de un caso de prueba.
+
+    Args:
+        test_case (APIData): Caso de prueba al que corresponde el resultado.
+        status (str): Estado de la prueba ("PASSED", "FAILED" o "SKIPPED").
+        error (str or None): Mensaje de error, si corresponde.
+        actual_status_code (int or None): Código de estado recibido, si la prueba se ejecutó.
+        duration (float or None): Duración de la solicitud, si la prueba se ejecutó.
+        response_size (int or None): Tamaño de la respuesta, si la prueba se ejecutó.
+
+    Returns:
+        dict: El resultado de la prueba, con las claves que se guardan en la base de datos.
+    """
+    return {
+        "TestId": test_case.TestId,
+        "TestCase": test_case.TestCase,
+        "Status": status,
+        "Error": error,
+        "Method": test_case.Method,
+        "URL": test_case.URL,
+        "Endpoint": test_case.Endpoint,
+        "ExpectedStatusCode": test_case.ExpectedStatusCode,
+        "ActualStatusCode": actual_status_code,
+        "Duration": duration,
+        "ResponseSize": response_size
+    }
+
+
+def run_test_case(client, test_case):
+    """
+    Ejecuta un único caso de prueba: envía la solicitud, mide el tiempo y verifica la respuesta.
+
+    Args:
+        client (APIClient): Instancia del cliente de la API.
+        test_case (APIData): Caso de prueba a ejecutar.
+
+    Returns:
+        dict: El resultado de la prueba, con las claves que se guardan en la base de datos.
+    """
+    # Prepara los encabezados y autenticación para la solicitud
+    headers, auth = prepare_headers_and_auth(test_case)
+
+    # Envía la solicitud y mide el tiempo
+    response, duration, response_size = send_request_and_measure_time(client, test_case, headers, auth)
+
+    # Verifica la respuesta recibida
+    status, error = check_response(response, test_case)
+
+    return build_result(test_case, status, error, response.status_code, duration, response_size)
+
+
 def test_api(test_data):
     """
     Función principal que ejecuta las pruebas API según los datos de prueba cargados desde un archivo Excel.
 
     Esta función se encarga de realizar las solicitudes a la API, verificar los resultados, guardar los resultados
-    en una base de datos y generar un resumen de las pruebas ejecutadas.
+    en una base de datos y generar un resumen de las pruebas ejecutadas. Las solicitudes se envían en paralelo,
+    ya que cada caso de prueba es independiente y el tiempo se pasa esperando a la red.
 
     Args:
         test_data (list): Lista de datos de prueba cargados desde un archivo Excel.
@@ -140,56 +263,27 @@ def test_api(test_data):
     if not execution_id:
         pytest.fail("No se pudo crear la ejecución en la base de datos.")
 
-    durations = []  # Lista para almacenar la duración de cada prueba
-    response_sizes = []  # Lista para almacenar el tamaño de la respuesta de cada prueba
-    results = []  # Lista para almacenar los resultados de las pruebas
+    # Separa antes de ejecutar los casos marcados para no ejecutarse (Run = N); solo el resto se envía
+    to_run = [test_case for test_case in test_data if test_case.Run != "N"]
 
-    for test_case in test_data:
-        if test_case.Run == "N":  # Si la prueba está marcada como no ejecutarse, se marca como saltada
-            status = "SKIPPED"
-            error = "Test skipped (Run = N)"
-        else:
-            # Prepara los encabezados y autenticación para la solicitud
-            headers, auth = prepare_headers_and_auth(test_case)
-
-            # Envía la solicitud y mide el tiempo
-            response, duration, response_size = send_request_and_measure_time(client, test_case, headers, auth)
-
-            # Verifica la respuesta recibida
-            status, error = check_response(response, test_case)
-
-        # Guarda el resultado de la prueba en la base de datos
-        result = {
-            "TestId": test_case.TestId,
-            "TestCase": test_case.TestCase,
-            "Status": status,
-            "Error": error,
-            "Method": test_case.Method,
-            "URL": test_case.URL,
-            "Endpoint": test_case.Endpoint,
-            "ExpectedStatusCode": test_case.ExpectedStatusCode,
-            "ActualStatusCode": response.status_code if status != "SKIPPED" else None,
-            "Duration": duration if status != "SKIPPED" else None,
-            "ResponseSize": response_size if status != "SKIPPED" else None
-        }
-
-        db_manager.insert_test_result(execution_id, result)  # Inserta el resultado en la base de datos
-
-        durations.append(duration)
-        response_sizes.append(response_size)
-        results.append(result)
-
-    # Inserta el resumen de las pruebas en la base de datos
-    summary = {
-        "TotalTests": len(test_data),
-        "PassedTests": sum(1 for r in results if r['Status'] == "PASSED"),
-        "FailedTests": sum(1 for r in results if r['Status'] == "FAILED"),
-        "SkippedTests": sum(1 for r in results if r['Status'] == "SKIPPED"),
-        "AvgDuration": sum(durations) / len(durations) if durations else 0,
-        "TotalResponseSize": sum(response_sizes),
-    }
+    # Ejecuta los casos de prueba en paralelo; al salir del bloque todos han terminado y `map` conserva su orden
+    with ThreadPoolExecutor(max_workers=config.MAX_WORKERS) as executor:
+        executed = executor.map(lambda test_case: run_test_case(client, test_case), to_run)
+
+    # Combina los resultados en el orden original, marcando como saltados los casos no ejecutados
+    results = [
+        next(executed) if test_case.Run != "N" else build_result(test_case, "SKIPPED", "Test skipped (Run = N)")
+        for test_case in test_data
+    ]
+
+    # Inserta todos los resultados en la base de datos en una única transacción
+    db_manager.insert_test_results(execution_id, results)
 
-    db_manager.insert_test_summary(execution_id, summary)
+    # Calcula el resumen de las pruebas en la base de datos y lo guarda
+    summary = db_manager.finalize_summary(execution_id)
+    if not summary:
+        pytest.fail("No se pudo generar el resumen de la ejecución en la base de datos.")
+    db_manager.close()  # Cierra la conexión persistente con la base de datos
 
     # Imprime un resumen de la ejecución de pruebas
     print("\n--- Resumen de la Ejecución de Pruebas ---")
@@ -201,4 +295,4 @@ def test_api(test_data):
     print(f"Tamaño total de respuestas: {summary['TotalResponseSize']} bytes")
 
     # Actualiza los resultados en el archivo Excel
-    ExcelWriter(config.EXCEL_PATH).update_results(results, execution_name)
+    ExcelWriter(config.EXCEL_PATH, config.REPORTS_DIR).update_results(results, execution_name)
@@ -0,0 +1,52 @@
+import openpyxl
+import pytest
+from core import fast_xlsx
+
+
+def test_write_sheet_round_trip(tmp_path):
+    """
+    El archivo generado con `write_sheet` se abre con `openpyxl` y conserva el nombre de la hoja, los valores
+    de cada celda y sus estilos.
+    """
+    rows = [
+        ("TestId", "Status", "Error"),
+        (1, 2.5, -3),
+        ('a & b < c > d "e"', " espacios ", None),
+        ("con\x00control\x1fchars", None, "fin"),
+        *((f"TC-{color}", fast_xlsx.StyledValue("ESTADO", fast_xlsx.fill_style(color)), None)
+          for color in fast_xlsx._FILL_STYLES),
+        (None, None, fast_xlsx.StyledValue("línea 1\nlínea 2", fast_xlsx.STYLE_WRAP)),
+    ]
+    path = tmp_path / "log.xlsx"
+
+    fast_xlsx.write_sheet(str(path), 'Log & "2024"', rows)
+
+    workbook = openpyxl.load_workbook(path)
+    assert workbook.sheetnames == ['Log & "2024"']
+    sheet = workbook.active
+
+    assert [list(row) for row in sheet.iter_rows(values_only=True)] == [
+        ["TestId", "Status", "Error"],
+        [1, 2.5, -3],
+        ['a & b < c > d "e"', " espacios ", None],
+        ["concontrolchars", None, "fin"],  # Los caracteres de control no permitidos en XML se descartan
+        *([f"TC-{color}", "ESTADO", None] for color in fast_xlsx._FILL_STYLES),
+        [None, None, "línea 1\nlínea 2"],
+    ]
+
+    for row_number, color in enumerate(fast_xlsx._FILL_STYLES, start=5):
+        cell = sheet.cell(row=row_number, column=2)
+        assert cell.fill.fill_type == "solid"
+        assert cell.fill.fgColor.rgb == f"00{color}"
+        assert cell.font.color.rgb == "00000000"
+        assert sheet.cell(row=row_number, column=1).fill.fill_type is None
+
+    assert sheet.cell(row=8, column=3).alignment.wrap_text
+
+
+@pytest.mark.parametrize("index, letter", [(0, "A"), (25, "Z"), (26, "AA"), (701, "ZZ"), (702, "AAA")])
+def test_column_letter(index, letter):
+    """
+    Los índices de columna se convierten en las mismas letras que usa Excel.
+    """
+    assert fast_xlsx._column_letter(index) == letter
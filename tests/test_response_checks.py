@@ -0,0 +1,200 @@
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import openpyxl
+import pytest
+from core.api_client import APIClient
+from core.excel_reader import ExcelReader
+from tests.test_api import run_test_case
+
+# Columnas de la hoja 'TestSuite', en el orden de la plantilla de datos de prueba
+SHEET_COLUMNS = ('TestId', 'TestCase', 'Run', 'Method', 'URL', 'Endpoint', 'Authorization', 'User', 'Password',
+                 'Headers', 'Body', 'ExpectedStatusCode', 'ExpectedResponse', 'Status', 'Error')
+
+# Cuerpo que no es un JSON válido aunque se anuncie como tal: solo se puede comparar si se intenta interpretar
+INVALID_JSON_BODY = b'not json' * 1024
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Servidor de prueba con una respuesta fija por endpoint.
+    """
+
+    protocol_version = "HTTP/1.1"  # Permite respuestas sin `Content-Length` (codificación por bloques)
+
+    def do_GET(self):
+        # Se descarta el cuerpo de la solicitud para que no quede en la conexión, que se reutiliza
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path == "/invalid-json":
+            self._send(INVALID_JSON_BODY, {"Content-Type": "application/json"})
+        elif self.path == "/gzip":
+            self._send(gzip.compress(INVALID_JSON_BODY),
+                       {"Content-Type": "application/json", "Content-Encoding": "gzip"})
+        elif self.path == "/chunked":
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for chunk in (INVALID_JSON_BODY[:1000], INVALID_JSON_BODY[1000:]):
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+        elif self.path == "/set-cookie":
+            self.send_response(200)
+            self.send_header("Set-Cookie", "session=abc; Path=/")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.path == "/without-cookie":
+            # Responde 200 solo si la solicitud no incluye cookies
+            self._send(b'{}', {"Content-Type": "application/json"}, status=400 if "Cookie" in self.headers else 200)
+        else:
+            self._send(b'{}', {"Content-Type": "application/json"}, status=404)
+
+    def _send(self, body, headers, status=200):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Sin registro de cada solicitud en la salida de las pruebas
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    """
+    Arranca el servidor de prueba en un puerto libre durante las pruebas del módulo.
+
+    Returns:
+        str: La URL base del servidor.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def load_cases(tmp_path, url, rows):
+    """
+    Genera una hoja 'TestSuite' con las filas indicadas y la carga con `ExcelReader`.
+
+    Args:
+        tmp_path (Path): Directorio temporal de la prueba.
+        url (str): URL base de los casos de prueba.
+        rows (list): Pares (endpoint, respuesta esperada); None deja la celda de la respuesta esperada vacía.
+
+    Returns:
+        list: Los casos de prueba cargados.
+    """
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "TestSuite"
+    sheet.append(SHEET_COLUMNS)
+    for number, (endpoint, expected_response) in enumerate(rows, start=1):
+        sheet.append((f"TC-{number:03}", f"Caso {number}", "Y", "GET", url, endpoint, None, None, None,
+                      None, None, 200, expected_response, None, None))
+    path = tmp_path / "test_data.xlsx"
+    workbook.save(path)
+    return ExcelReader(str(path)).load_data()
+
+
+def test_blank_expected_response_checks_status_only(tmp_path, server_url):
+    """
+    Una respuesta esperada vacía se carga como None y el caso se evalúa solo por su código de estado,
+    mientras que un `{}` explícito se sigue comparando con el cuerpo de la respuesta.
+    """
+    blank, empty_object = load_cases(tmp_path, server_url, [("/invalid-json", None), ("/invalid-json", "{}")])
+
+    assert blank.ExpectedResponse is None
+    assert empty_object.ExpectedResponse == {}
+
+    result = run_test_case(APIClient(), blank)
+    assert result["Status"] == "PASSED"
+    assert result["Error"] is None
+
+    result = run_test_case(APIClient(), empty_object)
+    assert result["Status"] == "FAILED"
+
+
+def test_unchecked_body_size_from_content_length(tmp_path, server_url, monkeypatch):
+    """
+    Si el caso no define una respuesta esperada y el cuerpo no está comprimido, su tamaño se toma del encabezado
+    `Content-Length` sin leerlo.
+    """
+    [test_case] = load_cases(tmp_path, server_url, [("/invalid-json", None)])
+
+    def fail_iter_content(self, *args, **kwargs):
+        raise AssertionError("El cuerpo no debería leerse")
+
+    monkeypatch.setattr("requests.Response.iter_content", fail_iter_content)
+    result = run_test_case(APIClient(), test_case)
+
+    assert result["Status"] == "PASSED"
+    assert result["ResponseSize"] == len(INVALID_JSON_BODY)
+
+
+@pytest.mark.parametrize("endpoint", ["/gzip", "/chunked"])
+def test_unchecked_body_size_from_streamed_body(tmp_path, server_url, endpoint):
+    """
+    Si el cuerpo está comprimido o no tiene `Content-Length`, su tamaño se cuenta leyéndolo por partes y coincide
+    con el del cuerpo descomprimido.
+    """
+    [test_case] = load_cases(tmp_path, server_url, [(endpoint, None)])
+
+    result = run_test_case(APIClient(), test_case)
+
+    assert result["Status"] == "PASSED"
+    assert result["ResponseSize"] == len(INVALID_JSON_BODY)
+
+
+def test_unchecked_body_is_not_parsed(tmp_path, server_url, monkeypatch):
+    """
+    Un caso que solo comprueba el código de estado no interpreta el cuerpo, y la respuesta queda cerrada
+    al terminar.
+    """
+    [test_case] = load_cases(tmp_path, server_url, [("/chunked", None)])
+    responses = []
+    send_request = APIClient.send_request
+
+    def record_response(*args, **kwargs):
+        response = send_request(*args, **kwargs)
+        responses.append(response)
+        return response
+
+    def fail_parse(response):
+        raise AssertionError("El cuerpo no debería interpretarse")
+
+    monkeypatch.setattr(APIClient, "send_request", staticmethod(record_response))
+    monkeypatch.setattr("tests.test_api.parse_response_body", fail_parse)
+    result = run_test_case(APIClient(), test_case)
+
+    assert result["Status"] == "PASSED"
+    assert responses[0].raw.closed
+
+
+@pytest.mark.parametrize("endpoint", ["/invalid-json", "/gzip", "/chunked"])
+def test_response_size_matches_with_and_without_body_check(tmp_path, server_url, endpoint):
+    """
+    El tamaño de la respuesta es el mismo tanto si el cuerpo se descarga entero para compararlo como si solo se
+    mide sin guardarlo.
+    """
+    unchecked, checked = load_cases(tmp_path, server_url, [(endpoint, None), (endpoint, '{"id": 1}')])
+
+    unchecked_result = run_test_case(APIClient(), unchecked)
+    checked_result = run_test_case(APIClient(), checked)
+
+    assert checked_result["Status"] == "FAILED"  # El cuerpo no es el esperado
+    assert unchecked_result["ResponseSize"] == checked_result["ResponseSize"] == len(INVALID_JSON_BODY)
+
+
+def test_cookies_are_not_shared_between_cases(tmp_path, server_url):
+    """
+    Las cookies que recibe un caso de prueba no se envían en los siguientes, aunque compartan la sesión HTTP.
+    """
+    login, check = load_cases(tmp_path, server_url, [("/set-cookie", None), ("/without-cookie", None)])
+
+    assert run_test_case(APIClient(), login)["Status"] == "PASSED"
+    assert run_test_case(APIClient(), check)["Status"] == "PASSED"
@@ -0,0 +1,32 @@
+import json
+from web.app import format_response_error
+
+
+def test_format_response_error_splits_expected_and_got():
+    """
+    Un mensaje de respuesta distinta a la esperada se separa en sus dos respuestas, formateadas como JSON.
+    """
+    expected_json, got_json = format_response_error("Expected response: {'id': 1}, Got: {\"id\": 2}")
+
+    assert json.loads(expected_json) == {"id": 1}
+    assert json.loads(got_json) == {"id": 2}
+
+
+def test_format_response_error_with_separator_in_expected_payload():
+    """
+    Si la respuesta esperada contiene el texto ", Got:", el mensaje se separa por el último separador.
+    """
+    expected = {"message": "Expected a, Got: b", "ids": [1, 2]}
+    got = {"message": "ok"}
+
+    expected_json, got_json = format_response_error(f"Expected response: {expected}, Got: {json.dumps(got)}")
+
+    assert json.loads(expected_json) == expected
+    assert json.loads(got_json) == got
+
+
+def test_format_response_error_other_messages():
+    """
+    Los mensajes de error que no comparan respuestas no se separan.
+    """
+    assert format_response_error("API request failed: timeout") is None
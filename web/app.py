@@ -1,9 +1,16 @@
+import ast
 import json
+import os
+import queue
+import re
 import sqlite3
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
 import dash
 import dash_bootstrap_components as dbc
 import pandas as pd
-from dash import html, dash_table
+from dash import dcc, html, dash_table
 from dash.dependencies import Input, Output, State
 
 import config
@@ -13,37 +20,179 @@ app = dash.Dash(__name__, external_stylesheets=[dbc.themes.DARKLY,
                                                 "https://fonts.googleapis.com/css2?family=Roboto:wght@400;500&display=swap"])
 
 
-def fetch_test_data(execution_id=None):
+# Conexiones de solo lectura libres, reutilizadas entre callbacks. Los callbacks pueden ejecutarse en varios hilos
+# a la vez: cada uno toma una conexión propia y la devuelve al terminar, y solo se abren conexiones nuevas cuando
+# todas las existentes están en uso. Cada conexión se guarda junto con la identidad del archivo que abrió
+_idle_connections = queue.SimpleQueue()
+
+# Identidad (dispositivo e inodo) del archivo de la base de datos en la última consulta. Si results.db se borra y se
+# vuelve a crear, los ids de sus filas empiezan de nuevo, de modo que las conexiones abiertas y los detalles de las
+# pruebas guardados en caché por id (`_cached_test_details`) corresponden a la base de datos anterior. Mientras el pool
+# mantiene abierto el archivo anterior, su inodo no puede reutilizarse, por lo que un archivo nuevo siempre tiene una
+# identidad distinta
+_db_identity = None
+
+
+def _current_db_identity():
     """
-    Obtiene los datos de las pruebas de la base de datos.
-    Si se proporciona un `execution_id`, filtra los resultados por ese ID.
+    Obtiene la identidad del archivo de la base de datos, o None si no existe.
     """
     try:
-        conn = sqlite3.connect(config.DB_PATH)
-        query = "SELECT * FROM test_results"
-        if execution_id:
-            query += f" WHERE ExecutionId = {execution_id}"
-        df = pd.read_sql(query, conn)  # Se convierte el resultado en un DataFrame de pandas
+        stat = os.stat(config.DB_PATH)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+def _clear_id_caches():
+    """
+    Vacía las cachés indexadas por ids de la base de datos; por ahora, solo la de los detalles de las pruebas.
+    """
+    _cached_test_details.cache_clear()
+
+
+def _check_db_identity():
+    """
+    Comprueba si el archivo de la base de datos ha cambiado desde la última consulta y, en ese caso, vacía las
+    cachés indexadas por id. Retorna la identidad actual del archivo.
+    """
+    global _db_identity
+    identity = _current_db_identity()
+    if identity != _db_identity:
+        _db_identity = identity
+        _clear_id_caches()
+    return identity
+
+
+def _connect():
+    """
+    Abre una conexión de solo lectura con la base de datos de resultados (el panel nunca escribe en ella).
+    La base de datos usa el modo WAL, configurado por `DBManager`, de modo que las lecturas no se bloquean
+    mientras una ejecución escribe, y sus páginas se leen mediante memoria mapeada y se conservan en la caché
+    de páginas de la conexión entre consultas.
+    """
+    uri = f"{Path(config.DB_PATH).resolve().as_uri()}?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    conn.execute("PRAGMA mmap_size = 268435456")  # Lee la base de datos mapeada en memoria (hasta 256 MB)
+    conn.execute("PRAGMA cache_size = -20000")  # Caché de páginas de unos 20 MB por conexión
+    return conn
+
+
+@contextmanager
+def _get_conn():
+    """
+    Toma una conexión libre del pool (o abre una nueva si no hay ninguna) y la devuelve al pool al terminar.
+    Las conexiones abiertas sobre un archivo de la base de datos que ya se ha sustituido se cierran y se descartan.
+    """
+    identity = _check_db_identity()
+    while True:
+        try:
+            conn_identity, conn = _idle_connections.get_nowait()
+        except queue.Empty:
+            conn = _connect()
+            break
+        if conn_identity == identity:
+            break
         conn.close()
-        return df
+    try:
+        yield conn
+    finally:
+        _idle_connections.put((identity, conn))
+
+
+def _read_sql(query, params=()):
+    """
+    Ejecuta una consulta con una conexión del pool y devuelve el resultado como un DataFrame de pandas.
+    Los valores se pasan siempre como parámetros, de modo que SQLite puede reutilizar la consulta preparada.
+    El DataFrame se construye directamente con las filas y los nombres de columna del cursor, sin pasar por la
+    capa SQL de pandas.
+    """
+    with _get_conn() as conn:
+        cursor = conn.execute(query, params)
+        columns = [description[0] for description in cursor.description]
+        return pd.DataFrame.from_records(cursor.fetchall(), columns=columns, coerce_float=True)
+
+
+# Columnas de `test_results` que necesita la tabla del panel; el resto solo se consulta para la prueba seleccionada
+_TABLE_QUERY_COLUMNS = "id, TestId, TestCase, Status, Duration"
+
+
+# Columnas por las que se puede ordenar la tabla; la duración se ordena por su valor numérico y no por el texto
+# formateado que se muestra
+SORTABLE_COLUMNS = ('TestId', 'TestCase', 'Status', 'Duration')
+
+
+def fetch_test_data(execution_id=None, limit=-1, offset=0, order_by='id', descending=False):
+    """
+    Obtiene de la base de datos las columnas de los resultados de las pruebas que se muestran en la tabla.
+    Si se proporciona un `execution_id`, filtra los resultados por ese ID. `limit` y `offset` seleccionan la
+    página de resultados a obtener (por defecto, todos) y `order_by` la columna por la que se ordenan, que debe
+    ser `id` o una de `SORTABLE_COLUMNS`; a igualdad de valor se mantiene el orden de inserción.
+    """
+    if order_by != 'id' and order_by not in SORTABLE_COLUMNS:
+        raise ValueError(f"Columna de ordenación no válida: {order_by}")
+    direction = "DESC" if descending else "ASC"
+    try:
+        # Usa el índice sobre ExecutionId
+        where = "WHERE ExecutionId = ?" if execution_id else ""
+        query = (f"SELECT {_TABLE_QUERY_COLUMNS} FROM test_results {where} "
+                 f"ORDER BY {order_by} {direction}, id {direction} LIMIT ? OFFSET ?")
+        params = (execution_id, limit, offset) if execution_id else (limit, offset)
+        return _read_sql(query, params)  # Se convierte el resultado en un DataFrame de pandas
     except Exception as e:
         print(f"Error al obtener los datos de las pruebas: {e}")
         return pd.DataFrame()  # Si ocurre un error, retorna un DataFrame vacío
 
 
+def fetch_test_result(result_id):
+    """
+    Obtiene todas las columnas de un único resultado de prueba dado su id, para mostrar sus detalles.
+    Retorna None si el resultado no existe o si ocurre un error.
+    """
+    try:
+        df = _read_sql("SELECT * FROM test_results WHERE id = ?", (result_id,))
+        return df.iloc[0] if not df.empty else None
+    except Exception as e:
+        print(f"Error al obtener el resultado de la prueba: {e}")
+        return None
+
+
+# Resumen de una ejecución calculado en la base de datos, que devuelve una única fila en lugar de todos los resultados
+_SUMMARY_QUERY = """
+    SELECT COUNT(*),
+           COALESCE(SUM(Status = 'PASSED'), 0),
+           COALESCE(SUM(Status = 'FAILED'), 0),
+           COALESCE(SUM(Status = 'SKIPPED'), 0),
+           COALESCE(AVG(Duration), 0)
+    FROM test_results
+    WHERE ExecutionId = ?
+"""
+
+
+def fetch_summary(execution_id):
+    """
+    Obtiene el resumen de una ejecución: total de pruebas, pruebas pasadas, falladas y saltadas, y duración
+    promedio (sin contar las pruebas sin duración).
+    """
+    try:
+        with _get_conn() as conn:
+            return conn.execute(_SUMMARY_QUERY, (execution_id,)).fetchone()
+    except Exception as e:
+        print(f"Error al obtener el resumen de la ejecución: {e}")
+        return 0, 0, 0, 0, 0  # Si ocurre un error, retorna un resumen vacío
+
+
 def fetch_executions():
     """
-    Obtiene una lista de las ejecuciones de pruebas desde la base de datos.
+    Obtiene la lista de las ejecuciones de pruebas desde la base de datos, como tuplas (ExecutionId, ExecutionName).
     """
     try:
-        conn = sqlite3.connect(config.DB_PATH)
         query = "SELECT DISTINCT ExecutionId, ExecutionName FROM test_executions"
-        df = pd.read_sql(query, conn)  # Se convierte el resultado en un DataFrame de pandas
-        conn.close()
-        return df
+        with _get_conn() as conn:
+            return conn.execute(query).fetchall()
     except Exception as e:
         print(f"Error al obtener las ejecuciones: {e}")
-        return pd.DataFrame()  # Si ocurre un error, retorna un DataFrame vacío
+        return []  # Si ocurre un error, retorna una lista vacía
 
 
 def get_execution_name(execution_id):
@@ -51,12 +200,11 @@ def get_execution_name(execution_id):
     Obtiene el nombre de la ejecución dada su ID.
     """
     try:
-        conn = sqlite3.connect(config.DB_PATH)
-        query = f"SELECT ExecutionName FROM test_executions WHERE ExecutionId = {execution_id}"
-        df = pd.read_sql(query, conn)  # Se convierte el resultado en un DataFrame de pandas
-        conn.close()
-        if not df.empty:
-            return df['ExecutionName'].iloc[0]
+        query = "SELECT ExecutionName FROM test_executions WHERE ExecutionId = ?"
+        with _get_conn() as conn:
+            row = conn.execute(query, (execution_id,)).fetchone()
+        if row is not None:
+            return row[0]
         return None  # Si no se encuentra el nombre, retorna None
     except Exception as e:
         print(f"Error al obtener el nombre de la ejecución: {e}")
@@ -75,6 +223,33 @@ def format_duration(duration):
         return "0 sec 0 ms"  # Si la duración es 0 o menor, retorna 0 segundos y 0 milisegundos
 
 
+def format_durations(durations, statuses):
+    """
+    Formatea una columna completa de duraciones con el mismo formato que `format_duration`, operando sobre
+    todos los valores a la vez. Las pruebas saltadas se dejan sin duración.
+    """
+    values = durations.astype(float)
+    values = values.where(values > 0, 0.0)  # Las duraciones nulas o no positivas se muestran como 0
+    seconds = values.astype("int64")
+    milliseconds = ((values - seconds) * 1000).astype("int64")
+    formatted = seconds.astype(str) + " sec " + milliseconds.astype(str) + " ms"
+    return formatted.where(statuses != "SKIPPED", "")
+
+
+# Columnas de los resultados que se envían a la tabla; `id` no se muestra, identifica la fila seleccionada
+TABLE_COLUMNS = ('id', 'TestId', 'TestCase', 'Status', 'Duration')
+
+
+def table_records(df):
+    """
+    Convierte las columnas de la tabla de resultados en la lista de registros que espera `DataTable`,
+    recorriendo directamente los valores de cada columna (ya convertidos a tipos nativos de Python) en lugar
+    de generar los diccionarios con pandas.
+    """
+    columns = [df[column].tolist() for column in TABLE_COLUMNS]
+    return [dict(zip(TABLE_COLUMNS, row)) for row in zip(*columns)]
+
+
 # Layout principal de la aplicación, que contiene todos los componentes visuales
 app.layout = html.Div(
     style={
@@ -107,6 +282,8 @@ app.layout = html.Div(
                         style={"borderRadius": "0px", "fontSize": "16px", "backgroundColor": "#333", "color": "#fff", "textAlign": "center", 'fontWeight': 'bold', 'textTransform': 'none', 'fontFamily': 'Roboto, sans-serif'},
                     ), width=2, style={"margin": "0 auto"}
                 ),
+                # Refresca periódicamente las opciones del filtro, para que aparezcan las ejecuciones nuevas
+                dcc.Interval(id="executions-refresh", interval=60_000, n_intervals=0),
             ], style={"marginBottom": "40px"}),
 
         # Fila para mostrar las métricas de pruebas (total, pasadas, fallidas, saltadas, duración promedio)
@@ -142,7 +319,14 @@ app.layout = html.Div(
         dbc.Row([
             dbc.Col(dash_table.DataTable(
                 id='test-results-table',
+                # La paginación y la ordenación se resuelven en la base de datos: la tabla solo recibe la página visible
+                page_action='custom',
+                page_current=0,
                 page_size=15,
+                page_count=1,
+                sort_action='custom',
+                sort_mode='single',
+                sort_by=[],
                 style_cell={'textAlign': 'left', 'fontFamily': 'Roboto, sans-serif', "backgroundColor": "#2b2b2b", "color": "#ffffff", "border": "none"},
                 columns=[
                     {'name': '🆔 Test ID', 'id': 'TestId'},
@@ -216,163 +400,232 @@ def safe_int(value):
         return 0  # Si ocurre un error al convertir, retorna 0
 
 
-# noinspection t
+# Estilo de los bloques de texto preformateado del modal (respuestas y mensajes de error)
+PRE_STYLE = {
+    "whiteSpace": "pre-wrap",
+    "wordBreak": "break-word",
+    "backgroundColor": "#333", "color": "#fff",
+    "padding": "10px",
+    "borderRadius": "5px"
+}
+
+# Color con el que se muestra cada estado en el modal; cualquier otro estado se muestra en amarillo
+STATUS_COLORS = {"PASSED": "green", "FAILED": "red", "SKIPPED": "yellow"}
+
+# Mensaje de error de una respuesta distinta a la esperada, tal como lo genera `check_response`:
+# "Expected response: <esperada>, Got: <obtenida>". Se separa por el último ", Got:", ya que la respuesta esperada
+# también puede contener ese texto
+_RESPONSE_ERROR_RE = re.compile(r"Expected response:\s*(.*),\s*Got:\s*(.*?)\s*$", re.DOTALL)
+
+
+def parse_payload(text):
+    """
+    Convierte el texto de una respuesta incluida en un mensaje de error en un objeto de Python, sin ejecutar
+    código: primero se interpreta como JSON y, si no lo es, como un literal de Python (el formato con el que
+    las pruebas guardan los diccionarios en el mensaje de error).
+    """
+    try:
+        return json.loads(text)
+    except ValueError:
+        return ast.literal_eval(text)
+
+
+@lru_cache(maxsize=512)
+def format_response_error(error_message):
+    """
+    Separa un mensaje de error de respuesta distinta a la esperada en sus dos respuestas, formateadas como JSON
+    indentado. Retorna la tupla (esperada, obtenida), o None si el mensaje no es de ese tipo. El resultado se
+    guarda en caché por mensaje, de modo que volver a abrir el detalle de la misma prueba no vuelve a interpretarlo.
+    """
+    response_match = _RESPONSE_ERROR_RE.match(error_message)
+    if not response_match:
+        return None
+    expected_text, got_text = response_match.groups()
+    expected_json = json.dumps(parse_payload(expected_text), indent=2) if expected_text else "{}"
+    return expected_json, json.dumps(parse_payload(got_text), indent=2)
+
+
+def build_test_details(selected_row_data):
+    """
+    Construye el contenido del modal con los detalles de una prueba a partir de su fila de resultados.
+    """
+    error_message = selected_row_data['Error']
+    formatted_error = None
+    if error_message:
+        try:
+            # Formatear los errores para que sean más legibles
+            responses = format_response_error(error_message)
+            if responses:
+                expected_json, got_json = responses
+                formatted_error = html.Div([
+                    html.Details([
+                        html.Summary("Ver respuesta esperada"),
+                        html.Pre(expected_json, style=PRE_STYLE)
+                    ]),
+                    html.Details([
+                        html.Summary("Ver respuesta obtenida (Got)"),
+                        html.Pre(got_json, style=PRE_STYLE)
+                    ])
+                ])
+            else:
+                formatted_error = html.Pre(error_message, style=PRE_STYLE)
+        except Exception as e:
+            formatted_error = html.Pre(error_message, style=PRE_STYLE)
+
+    status = selected_row_data['Status']
+    expected_status_code = safe_int(selected_row_data['ExpectedStatusCode'])
+    details = [
+        html.P(f"Test ID: {selected_row_data['TestId']}"),
+        html.P(f"Test Case: {selected_row_data['TestCase']}"),
+        html.P(["Status: ", html.Span(status, style={"color": STATUS_COLORS.get(status, "yellow")})]),
+        html.P(f"Method: {selected_row_data['Method']}"),
+        html.P(f"URL: {selected_row_data['URL']}"),
+        html.P(f"Endpoint: {selected_row_data['Endpoint']}"),
+    ]
+
+    # Las pruebas saltadas no tienen respuesta: solo se muestra el código esperado, sin párrafos vacíos para el resto
+    if status == "SKIPPED":
+        details.append(html.P(f"Expected Status Code: {expected_status_code}"))
+    else:
+        actual_status_code = safe_int(selected_row_data['ActualStatusCode'])
+        details += [
+            html.P([
+                "Expected Status Code: ",
+                html.Span(expected_status_code,
+                          style={"color": "red" if expected_status_code != actual_status_code else ""})
+            ]),
+            html.P(f"Status Code: {actual_status_code}"),
+            html.P(f"Duration: {format_duration(selected_row_data['Duration'])}"),
+            html.P(f"Response Size: {selected_row_data['ResponseSize']} bytes"),
+        ]
+        if formatted_error:
+            details.append(html.Div([html.P("Error:"), formatted_error]))
+
+    return html.Div(details)
+
+
+@lru_cache(maxsize=256)
+def _cached_test_details(result_id):
+    """
+    Construye el contenido del modal de un resultado de prueba dado su id. El resultado se guarda en caché, ya que
+    los resultados no cambian una vez insertados (la caché se vacía si la base de datos se vuelve a crear, ver
+    `_check_db_identity`); si el resultado no se puede obtener se lanza `LookupError`, que no se guarda en caché.
+    """
+    selected_row_data = fetch_test_result(result_id)
+    if selected_row_data is None:
+        raise LookupError(result_id)
+    return build_test_details(selected_row_data)
+
+
+def get_test_details(result_id):
+    """
+    Obtiene el contenido del modal de un resultado de prueba dado su id, o None si no se puede obtener.
+    """
+    try:
+        return _cached_test_details(result_id)
+    except LookupError:
+        return None
+
+
+@app.callback(
+    Output("execution-filter", "options"),  # Actualiza las opciones del dropdown de ejecuciones
+    Input("executions-refresh", "n_intervals"),  # Al cargar la página y después una vez por minuto
+)
+def update_execution_options(n_intervals):
+    """
+    Actualiza las opciones del filtro con las ejecuciones registradas en la base de datos, de la más reciente
+    a la más antigua. Se ejecuta al cargar la página y periódicamente, no cada vez que se selecciona una ejecución.
+    """
+    return [{'label': name, 'value': execution_id} for execution_id, name in reversed(fetch_executions())]
+
+
 @app.callback(
     [
-        Output("execution-filter", "options"),  # Actualiza las opciones del dropdown de ejecuciones
         Output("total-tests", "children"),
         Output("passed-tests", "children"),
         Output("failed-tests", "children"),
         Output("skipped-tests", "children"),
         Output("avg-duration", "children"),
-        Output("test-results-table", "data"),
-        Output("test-modal", "is_open"),
-        Output("test-details", "children")
+        Output("test-results-table", "page_count"),
+        Output("test-results-table", "page_current"),
     ],
+    Input("execution-filter", "value"),  # Cuando el usuario selecciona una ejecución
+    State("test-results-table", "page_size"),
+)
+def update_report(execution_id, page_size):
+    """
+    Actualiza el resumen y el número de páginas de la tabla cuando el usuario selecciona una ejecución.
+    La tabla vuelve a su primera página, ya que sus filas pasan a ser las de otra ejecución.
+    """
+    if not execution_id:
+        return 0, 0, 0, 0, 0, 1, 0
+
+    # Obtener el resumen de la ejecución, calculado en la base de datos
+    total_tests, passed_tests, failed_tests, skipped_tests, avg_duration = fetch_summary(execution_id)
+    avg_duration_str = format_duration(avg_duration)  # Formato legible de la duración promedio
+    page_count = max(1, -(-total_tests // page_size))  # Al menos una página, aunque la ejecución esté vacía
+
+    return total_tests, passed_tests, failed_tests, skipped_tests, avg_duration_str, page_count, 0
+
+
+@app.callback(
+    [Output("test-results-table", "data"), Output("test-results-table", "selected_rows")],
     [
         Input("execution-filter", "value"),  # Cuando el usuario selecciona una ejecución
-        Input("test-results-table", "selected_rows"),  # Cuando el usuario selecciona una fila de la tabla
-        Input("close-modal", "n_clicks"),  # Cuando el usuario hace clic en el botón "Cerrar" del modal
+        Input("test-results-table", "page_current"),  # Cuando el usuario cambia de página
+        Input("test-results-table", "page_size"),
+        Input("test-results-table", "sort_by"),  # Cuando el usuario ordena por una columna
     ],
+)
+def update_table_page(execution_id, page_current, page_size, sort_by):
+    """
+    Obtiene de la base de datos solo la página visible de la tabla de resultados, en el orden elegido.
+    La selección de la tabla se reinicia, ya que se refiere a las filas de la página anterior.
+    """
+    if not execution_id:
+        return [], []
+
+    order_by, descending = 'id', False
+    if sort_by and sort_by[0]['column_id'] in SORTABLE_COLUMNS:
+        order_by, descending = sort_by[0]['column_id'], sort_by[0]['direction'] == 'desc'
+    page_current = page_current or 0
+    df_results = fetch_test_data(execution_id, page_size, page_current * page_size, order_by, descending)
+    if df_results.empty:
+        return [], []
+
+    # Preparar los datos para la tabla de resultados, formateando la duración sobre la columna completa
+    table_data = table_records(df_results.assign(
+        Duration=format_durations(df_results['Duration'], df_results['Status'])))
+
+    return table_data, []
+
+
+@app.callback(
+    [Output("test-modal", "is_open"), Output("test-details", "children")],
+    Input("test-results-table", "selected_rows"),  # Cuando el usuario selecciona una fila de la tabla
     [State("test-results-table", "data"), State("test-modal", "is_open")]
 )
+def show_test_details(selected_rows, table_data, is_open):
+    """
+    Abre el modal con los detalles de la prueba seleccionada en la tabla. Solo consulta la fila seleccionada,
+    sin recalcular el resumen ni la tabla, y reutiliza el contenido ya construido si se vuelve a abrir.
+    """
+    # Si hay una fila seleccionada y el modal no está abierto, mostrar los detalles y abrir el modal
+    if selected_rows and table_data and not is_open:
+        test_details = get_test_details(table_data[selected_rows[0]]['id'])
+        if test_details is not None:
+            return True, test_details
+
+    return False, None
 
 
-def update_report(execution_id, selected_rows, close_modal_clicks, table_data, is_open):
-    """
-    Esta función maneja la lógica de actualización del reporte cada vez que el usuario interactúa
-    con los filtros, las filas seleccionadas de la tabla o el botón para cerrar el modal.
-    """
-    # Obtener las ejecuciones y actualizar las opciones del filtro
-    executions = fetch_executions()
-    execution_options = [{'label': exec['ExecutionName'], 'value': exec['ExecutionId']} for _, exec in
-                         executions.iloc[::-1].iterrows()]
-
-    if execution_id:
-        # Si se selecciona una ejecución, obtener los resultados correspondientes
-        df_results = fetch_test_data(execution_id)
-        total_tests = len(df_results)  # Número total de pruebas
-        passed_tests = len(df_results[df_results['Status'] == 'PASSED'])  # Pruebas pasadas
-        failed_tests = len(df_results[df_results['Status'] == 'FAILED'])  # Pruebas falladas
-        skipped_tests = len(df_results[df_results['Status'] == 'SKIPPED'])  # Pruebas saltadas
-        avg_duration = df_results['Duration'].mean() if not df_results[
-            'Duration'].isnull().all() else 0  # Duración promedio
-        avg_duration_str = format_duration(avg_duration)  # Formato legible de la duración promedio
-
-        # Formatear la duración de las pruebas en la tabla
-        df_results['Duration'] = df_results.apply(
-            lambda row: format_duration(row['Duration']) if row['Status'] != "SKIPPED" else "",
-            axis=1
-        )
-
-        # Preparar los datos para la tabla de resultados
-        table_data = df_results[['TestId', 'TestCase', 'Status', 'Duration']].to_dict('records')
-
-        # Si hay una fila seleccionada, mostrar los detalles en el modal
-        if selected_rows:
-            selected_row_data = df_results.iloc[selected_rows[0]]
-            error_message = selected_row_data['Error']
-            formatted_error = None
-            if error_message:
-                try:
-                    if "Expected response:" in error_message and "Got:" in error_message:
-                        plain_text, responses = error_message.split("Got:", 1)
-                        expected_text, got_text = plain_text.split("Expected response:", 1)
-
-                        # Formatear los errores para que sean más legibles
-                        expected_json = json.dumps(eval(expected_text.strip()),
-                                                   indent=2) if expected_text.strip() else "{}"
-                        got_json = json.dumps(eval(responses.strip()), indent=2)
-
-                        formatted_error = html.Div([
-                            html.Details([
-                                html.Summary("Ver respuesta esperada"),
-                                html.Pre(expected_json, style={
-                                    "whiteSpace": "pre-wrap",
-                                    "wordBreak": "break-word",
-                                    "backgroundColor": "#333", "color": "#fff",
-                                    "padding": "10px",
-                                    "borderRadius": "5px"
-                                })
-                            ]),
-                            html.Details([
-                                html.Summary("Ver respuesta obtenida (Got)"),
-                                html.Pre(got_json, style={
-                                    "whiteSpace": "pre-wrap",
-                                    "wordBreak": "break-word",
-                                    "backgroundColor": "#333", "color": "#fff",
-                                    "padding": "10px",
-                                    "borderRadius": "5px"
-                                })
-                            ])
-                        ])
-                    else:
-                        formatted_error = html.Pre(error_message, style={
-                            "whiteSpace": "pre-wrap",
-                            "wordBreak": "break-word",
-                            "backgroundColor": "#333", "color": "#fff",
-                            "padding": "10px",
-                            "borderRadius": "5px"
-                        })
-                except Exception as e:
-                    formatted_error = html.Pre(error_message, style={
-                        "whiteSpace": "pre-wrap",
-                        "wordBreak": "break-word",
-                        "backgroundColor": "#333", "color": "#fff",
-                        "padding": "10px",
-                        "borderRadius": "5px"
-                    })
-
-            test_details = html.Div([
-                html.P(f"Test ID: {selected_row_data['TestId']}"),
-                html.P(f"Test Case: {selected_row_data['TestCase']}"),
-                html.P([
-                    "Status: ",
-                    html.Span(
-                        selected_row_data['Status'],
-                        style={
-                            "color": "green" if selected_row_data['Status'] == "PASSED" else
-                            "red" if selected_row_data['Status'] == "FAILED" else
-                            "yellow"
-                        }
-                    )
-                ]),
-                html.P(f"Method: {selected_row_data['Method']}"),
-                html.P(f"URL: {selected_row_data['URL']}"),
-                html.P(f"Endpoint: {selected_row_data['Endpoint']}"),
-
-                html.P([
-                           "Expected Status Code: ",
-                           html.Span(
-                               safe_int(selected_row_data['ExpectedStatusCode']),
-                               style={
-                                   "color": "red" if selected_row_data['Status'] != "SKIPPED" and safe_int(
-                                       selected_row_data['ExpectedStatusCode']) != safe_int(
-                                       selected_row_data['ActualStatusCode']) else ""
-                               }
-                           )
-                       ] if selected_row_data['Status'] != "SKIPPED" else f"Expected Status Code: {safe_int(selected_row_data['ExpectedStatusCode'])}"),
-
-                html.P(f"Status Code: {safe_int(selected_row_data['ActualStatusCode'])}" if selected_row_data[
-                                                                                                'Status'] != "SKIPPED" else ""),
-
-                html.P(
-                    f"Duration: {selected_row_data['Duration']}" if selected_row_data['Status'] != "SKIPPED" else ""),
-                html.P(f"Response Size: {selected_row_data['ResponseSize']} bytes" if selected_row_data[
-                                                                                          'Status'] != "SKIPPED" else ""),
-
-                *([html.Div([html.P("Error:"), formatted_error])] if selected_row_data[
-                                                                         'Status'] != "SKIPPED" and formatted_error else []),
-            ])
-
-            # Si el modal no está abierto, mostrar los detalles y abrir el modal
-            if not is_open:
-                return execution_options, total_tests, passed_tests, failed_tests, skipped_tests, avg_duration_str, table_data, True, test_details
-
-        # Si no se ha seleccionado ninguna fila, devolver los valores estándar
-        return execution_options, total_tests, passed_tests, failed_tests, skipped_tests, avg_duration_str, table_data, False, None
-
-    return execution_options, 0, 0, 0, 0, 0, [], False, None
+# Cerrar el modal cuando el usuario hace clic en "Cerrar" se resuelve en el navegador, sin pasar por el servidor
+app.clientside_callback(
+    "function(n_clicks) { return false; }",
+    Output("test-modal", "is_open", allow_duplicate=True),
+    Input("close-modal", "n_clicks"),
+    prevent_initial_call=True,
+)
 
 
 # Arrancar la aplicación